@@ -129,29 +129,29 @@ class AdminHelpers:
     @staticmethod
     def is_admin(user_id: int) -> bool:
         """Check if user is admin."""
-        return user_id in settings.admin_list
+        return settings.is_admin(user_id)
 
     @staticmethod
     async def get_system_stats(db_manager: DatabaseManager) -> Dict[str, Any]:
         """Get comprehensive system statistics."""
         try:
-            async with db_manager.session() as session:
+            async with db_manager.session(readonly=True) as session:
                 # User stats
-                total_users = await session.scalar(select(func.count(User.id)))
+                total_users = await session.scalar(select(func.count()).select_from(User))
                 active_users = await session.scalar(
-                    select(func.count(User.id)).where(User.status == UserStatus.ACTIVE)
+                    select(func.count()).select_from(User).where(User.status == UserStatus.ACTIVE)
                 )
                 premium_users = await session.scalar(
-                    select(func.count(User.id)).where(User.is_premium == True)
+                    select(func.count()).select_from(User).where(User.is_premium == True)
                 )
 
                 # Link stats
-                total_links = await session.scalar(select(func.count(MonitoredLink.id)))
+                total_links = await session.scalar(select(func.count()).select_from(MonitoredLink))
                 active_links = await session.scalar(
-                    select(func.count(MonitoredLink.id)).where(MonitoredLink.is_active == True)
+                    select(func.count()).select_from(MonitoredLink).where(MonitoredLink.is_active == True)
                 )
                 up_links = await session.scalar(
-                    select(func.count(MonitoredLink.id)).where(MonitoredLink.is_up == True)
+                    select(func.count()).select_from(MonitoredLink).where(MonitoredLink.is_up == True)
                 )
 
                 # Performance stats
@@ -159,7 +159,7 @@ class BotHelpers:
     @staticmethod
     def is_admin(user_id: int) -> bool:
         """Check if user is admin."""
-        return user_id in settings.admin_list
+        return settings.is_admin(user_id)
 
     @staticmethod
     def format_link_info(link: MonitoredLink) -> str:
@@ -11,14 +11,15 @@ License: MIT
 """
 
 import asyncio
-from typing import Optional
+from typing import List, Optional
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import BotCommand, BotCommandScopeChat
 
 from database.manager import DatabaseManager
-from bot.handlers DatabaseManager router
+from bot.handlers import router
 from bot.admin_handlers import admin_router
 from utils import get_logger
 from config import get_settings
@@ -28,6 +29,24 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 
+# Command menus, built once and shared by every _set_bot_commands call
+_USER_COMMANDS = [
+    BotCommand(command="start", description="Start the bot"),
+    BotCommand(command="help", description="Show help"),
+    BotCommand(command="add", description="Add new link"),
+    BotCommand(command="list", description="Show all links"),
+    BotCommand(command="stats", description="Show statistics"),
+    BotCommand(command="settings", description="Bot settings"),
+]
+
+_ADMIN_COMMANDS = _USER_COMMANDS + [
+    BotCommand(command="admin", description="Admin panel"),
+    BotCommand(command="broadcast", description="Broadcast message"),
+    BotCommand(command="users", description="List all users"),
+    BotCommand(command="system", description="System status"),
+]
+
+
 # ============================================================================
 # BOT MANAGER CLASS
 # ============================================================================
@@ -48,7 +67,9 @@ class BotManager:
         self.db_manager = db_manager
         self.bot: Optional[Bot] = None
         self.dp: Optional[Dispatcher] = None
+        self._allowed_updates: Optional[List[str]] = None
         self._is_running = False
+        self._stop_event = asyncio.Event()
 
         logger.info("BotManager initialized")
 
@@ -76,7 +97,8 @@ class BotManager:
             self.dp.include_router(router)
             self.dp.include_router(admin_router)
 
-            # Register middleware to inject db_manager
+            # Register middleware to inject db_manager; handlers open their
+            # own short db_manager.session() scopes around their queries
             @self.dp.message.middleware()
             async def db_middleware(handler, event, data):
                 data['db_manager'] = self.db_manager
@@ -89,6 +111,9 @@ class BotManager:
                 data['bot'] = self.bot
                 return await handler(event, data)
 
+            # Resolve the update types the routers handle once, up front
+            self._allowed_updates = self.dp.resolve_used_update_types()
+
             # Set bot commands
             await self._set_bot_commands()
 
@@ -101,36 +126,25 @@ class BotManager:
 
     async def _set_bot_commands(self):
         """Set bot commands for menu."""
-        from aiogram.types import BotCommand
-
-        commands = [
-            BotCommand(command="start", description="Start the bot"),
-            BotCommand(command="help", description="Show help"),
-            BotCommand(command="add", description="Add new link"),
-            BotCommand(command="list", description="Show all links"),
-            BotCommand(command="stats", description="Show statistics"),
-            BotCommand(command="settings", description="Bot settings"),
-        ]
-
-        # Add admin commands for admin users
-        admin_commands = commands + [
-            BotCommand(command="admin", description="Admin panel"),
-            BotCommand(command="broadcast", description="Broadcast message"),
-            BotCommand(command="users", description="List all users"),
-            BotCommand(command="system", description="System status"),
-        ]
-
         try:
             # Set default commands
-            await self.bot.set_my_commands(commands)
+            await self.bot.set_my_commands(_USER_COMMANDS)
             
-            # Set admin commands for owner
-            from aiogram.types import BotCommandScopeChat
-            for admin_id in settings.admin_list:
-                await self.bot.set_my_commands(
-                    admin_commands,
-                    scope=BotCommandScopeChat(chat_id=admin_id)
-                )
+            # Set admin commands for every admin concurrently
+            admin_ids = settings.admin_list
+            results = await asyncio.gather(
+                *(
+                    self.bot.set_my_commands(
+                        _ADMIN_COMMANDS,
+                        scope=BotCommandScopeChat(chat_id=admin_id)
+                    )
+                    for admin_id in admin_ids
+                ),
+                return_exceptions=True
+            )
+            for admin_id, result in zip(admin_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error setting admin commands for {admin_id}: {result}")
 
             logger.info("Bot commands set successfully")
 
@@ -153,7 +167,7 @@ class BotManager:
             # Start polling
             await self.dp.start_polling(
                 self.bot,
-                allowed_updates=self.dp.resolve_used_update_types()
+                allowed_updates=self._allowed_updates
             )
 
         except Exception as e:
@@ -177,6 +191,7 @@ class BotManager:
 
             logger.info(f"Starting bot webhook on {webhook_url}")
             self._is_running = True
+            self._stop_event.clear()
 
             # Set webhook
             await self.bot.set_webhook(
@@ -208,9 +223,8 @@ class BotManager:
 
             logger.info(f"✓ Webhook started on port {port}")
 
-            # Keep running
-            while self._is_running:
-                await asyncio.sleep(1)
+            # Keep running until stop() is called
+            await self._stop_event.wait()
 
         except Exception as e:
             logger.error(f"Error in webhook: {e}", exc_info=True)
@@ -222,6 +236,7 @@ class BotManager:
         try:
             logger.info("Stopping bot...")
             self._is_running = False
+            self._stop_event.set()
 
             if self.bot:
                 # Delete webhook
@@ -10,6 +10,18 @@ License: MIT
 ============================================================================
 """
 
-from config.settings import get_settings, Settings
+from config.settings import (
+    get_settings,
+    clear_settings_cache,
+    fast_reload_settings,
+    Settings,
+    DatabaseSettings,
+)
 
-__all__ = ["get_settings", "Settings"]
+__all__ = [
+    "get_settings",
+    "clear_settings_cache",
+    "fast_reload_settings",
+    "Settings",
+    "DatabaseSettings",
+]
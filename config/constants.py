@@ -7,8 +7,8 @@ static configuration used throughout the application.
 
 from __future__ import annotations
 
-from enum import Enum, IntEnum, auto
-from typing import Dict, List, Set, Tuple, Final
+from enum import Enum, IntEnum, IntFlag, auto
+from typing import List, Set, Tuple, Final
 from dataclasses import dataclass
 
 
@@ -367,6 +367,28 @@ class TimeIntervals(IntEnum):
         ]
 
 
+class Feature(IntFlag):
+    """
+    Feature Flags
+    
+    Bitfield of optional features; test with ``Feature.X in settings.features``.
+    """
+    
+    PREMIUM_FEATURES = auto()
+    ADMIN_PANEL = auto()
+    USER_DASHBOARD = auto()
+    EXPORT_DATA = auto()
+    IMPORT_DATA = auto()
+    BATCH_OPERATIONS = auto()
+    SCHEDULED_REPORTS = auto()
+    CUSTOM_DOMAINS = auto()
+    SSL_MONITORING = auto()
+    DNS_MONITORING = auto()
+    API_MONITORING = auto()
+    EXPERIMENTAL = auto()
+    BETA = auto()
+
+
 class HTTPMethods(str, Enum):
     """HTTP Methods for ping requests."""
     
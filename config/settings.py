@@ -11,12 +11,212 @@ License: MIT
 """
 
 import os
-from typing import List, Optional, Dict, Any
+import re
+from typing import List, Optional, Dict, Any, Tuple, Type, Mapping, FrozenSet
 from pathlib import Path
-from functools import lru_cache
+from functools import cache, lru_cache, cached_property
+from urllib.parse import quote
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, computed_field
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    SettingsConfigDict,
+    PydanticBaseSettingsSource,
+    EnvSettingsSource,
+    DotEnvSettingsSource,
+)
+from pydantic_settings.sources import read_env_file
+
+from config.constants import Feature
+
+
+# Boolean setting backing each feature flag
+_FEATURE_FIELDS: Dict[Feature, str] = {
+    Feature.PREMIUM_FEATURES: "ENABLE_PREMIUM_FEATURES",
+    Feature.ADMIN_PANEL: "ENABLE_ADMIN_PANEL",
+    Feature.USER_DASHBOARD: "ENABLE_USER_DASHBOARD",
+    Feature.EXPORT_DATA: "ENABLE_EXPORT_DATA",
+    Feature.IMPORT_DATA: "ENABLE_IMPORT_DATA",
+    Feature.BATCH_OPERATIONS: "ENABLE_BATCH_OPERATIONS",
+    Feature.SCHEDULED_REPORTS: "ENABLE_SCHEDULED_REPORTS",
+    Feature.CUSTOM_DOMAINS: "ENABLE_CUSTOM_DOMAINS",
+    Feature.SSL_MONITORING: "ENABLE_SSL_MONITORING",
+    Feature.DNS_MONITORING: "ENABLE_DNS_MONITORING",
+    Feature.API_MONITORING: "ENABLE_API_MONITORING",
+    Feature.EXPERIMENTAL: "EXPERIMENTAL_FEATURES",
+    Feature.BETA: "BETA_FEATURES",
+}
+
+# Shared immutable defaults for list settings
+_DEFAULT_CORS_ORIGINS: Tuple[str, ...] = ("*",)
+_DEFAULT_CORS_METHODS: Tuple[str, ...] = ("GET", "POST", "PUT", "DELETE")
+_DEFAULT_CORS_HEADERS: Tuple[str, ...] = ("*",)
+_DEFAULT_SUPPORTED_LANGUAGES: Tuple[str, ...] = ("en", "ru", "es", "fr", "de")
+
+_VALID_LOG_LEVELS: FrozenSet[str] = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
-from pydantic import Field, field_validator, computed_field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# ============================================================================
+# SETTINGS SOURCES
+# ============================================================================
+
+@lru_cache(maxsize=2)
+def _environ_snapshot(case_sensitive: bool) -> Mapping[str, Optional[str]]:
+    """
+    Copy the process environment once.
+
+    Args:
+        case_sensitive: Whether keys keep their case
+
+    Returns:
+        Snapshot of ``os.environ``
+    """
+    if case_sensitive:
+        return os.environ.copy()
+    return {key.lower(): value for key, value in os.environ.items()}
+
+
+@lru_cache(maxsize=8)
+def _parse_env_file(
+    env_path: Path,
+    mtime_ns: int,
+    encoding: Optional[str],
+    case_sensitive: bool
+) -> Mapping[str, Optional[str]]:
+    """
+    Parse an env file once per modification time.
+
+    Args:
+        env_path: Resolved path to the env file
+        mtime_ns: File modification time, so edits invalidate the entry
+        encoding: File encoding
+        case_sensitive: Whether keys keep their case
+
+    Returns:
+        Parsed variables
+    """
+    return read_env_file(env_path, encoding=encoding, case_sensitive=case_sensitive)
+
+
+class JsonOrCsvEnvSettingsSource(EnvSettingsSource):
+    """
+    Environment source that accepts list fields as JSON or comma-separated values.
+
+    ``ADMIN_IDS=1,2,3`` and ``ADMIN_IDS=[1, 2, 3]`` both load as ``[1, 2, 3]``;
+    element conversion is left to pydantic validation.
+
+    The process environment is read once per process (see
+    ``clear_settings_cache``), and only variables that name a declared field
+    are kept, so per-field lookups probe a small dict.
+    """
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        """Load variables from the environment snapshot."""
+        return self._declared_only(_environ_snapshot(self.case_sensitive))
+
+    def _declared_only(
+        self,
+        env_vars: Mapping[str, Optional[str]]
+    ) -> Dict[str, Optional[str]]:
+        """Keep only variables that map to a settings field."""
+        field_names = (
+            self._apply_case_sensitive(f"{self.env_prefix}{name}")
+            for name in self.settings_cls.model_fields
+        )
+        return {name: env_vars[name] for name in field_names if name in env_vars}
+
+    def prepare_field_value(
+        self,
+        field_name: str,
+        field: FieldInfo,
+        value: Any,
+        value_is_complex: bool
+    ) -> Any:
+        """Split CSV strings for list fields, defer everything else to pydantic."""
+        if (
+            isinstance(value, str)
+            and self.field_is_complex(field)
+            and not value.lstrip().startswith("[")
+        ):
+            return [item for raw in value.split(",") if (item := raw.strip())]
+        return super().prepare_field_value(field_name, field, value, value_is_complex)
+
+
+class JsonOrCsvDotEnvSettingsSource(JsonOrCsvEnvSettingsSource, DotEnvSettingsSource):
+    """
+    ``.env`` file source with the same JSON-or-CSV list handling.
+
+    Parsed files are cached, so building ``Settings`` again does not
+    re-read ``.env`` unless it has changed on disk.
+    """
+
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        """Load variables from the env files."""
+        return self._declared_only(self._read_env_files(self.case_sensitive))
+
+    def _read_env_files(self, case_sensitive: bool) -> Mapping[str, Optional[str]]:
+        """Merge the configured env files, reusing cached parses."""
+        env_files = self.env_file
+        if env_files is None:
+            return {}
+        if isinstance(env_files, (str, os.PathLike)):
+            env_files = [env_files]
+
+        dotenv_vars: Dict[str, Optional[str]] = {}
+        for env_file in env_files:
+            env_path = Path(env_file).expanduser()
+            try:
+                mtime_ns = env_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if env_path.is_file():
+                dotenv_vars.update(_parse_env_file(
+                    env_path.resolve(), mtime_ns, self.env_file_encoding, case_sensitive
+                ))
+        return dotenv_vars
+
+    def __call__(self) -> Dict[str, Any]:
+        """
+        Collect field values without re-scanning for undeclared keys.
+
+        ``DotEnvSettingsSource`` copies every unknown ``.env`` key into the
+        result for ``extra`` handling; ``env_vars`` only ever holds declared
+        fields here, so that pass (and pydantic's extra filtering) is skipped.
+        """
+        return EnvSettingsSource.__call__(self)
+
+
+# ============================================================================
+# DATABASE SETTINGS
+# ============================================================================
+
+class DatabaseSettings(BaseModel):
+    """
+    Database connection settings, grouped for the connection manager.
+
+    Built from the flat ``DB_*`` fields by ``Settings.database``; never
+    read from the environment directly.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    url: str = Field(..., repr=False, description="SQLAlchemy async database URL")
+    host: str
+    port: int
+    name: str
+    echo: bool = False
+    echo_pool: bool = False
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    strict_preping: bool
+    statement_cache_size: int
+    pool_use_lifo: bool
+    ping_idle_seconds: int
+    ping_ttl: float
+    trace_pool: bool
 
 
 # ============================================================================
@@ -27,15 +227,47 @@ class Settings(BaseSettings):
     """
     Application settings with comprehensive configuration options.
     All settings can be overridden via environment variables.
+
+    Instances are frozen: values are fixed once loaded from the environment.
     """
 
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: EnvSettingsSource,
+        dotenv_settings: DotEnvSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Swap in env sources that parse comma-separated list fields."""
+        return (
+            init_settings,
+            JsonOrCsvEnvSettingsSource(
+                settings_cls,
+                case_sensitive=env_settings.case_sensitive,
+                env_prefix=env_settings.env_prefix,
+                env_nested_delimiter=env_settings.env_nested_delimiter,
+            ),
+            JsonOrCsvDotEnvSettingsSource(
+                settings_cls,
+                env_file=dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+                case_sensitive=dotenv_settings.case_sensitive,
+                env_prefix=dotenv_settings.env_prefix,
+                env_nested_delimiter=dotenv_settings.env_nested_delimiter,
+            ),
+            file_secret_settings,
+        )
+
     # ========================================================================
     # TELEGRAM BOT CONFIGURATION
     # ========================================================================
@@ -51,26 +283,46 @@ class Settings(BaseSettings):
     
     # Admin Configuration
     OWNER_ID: int = Field(..., description="Bot owner Telegram user ID")
-    ADMIN_IDS: str = Field(default="", description="Comma-separated admin user IDs")
+    ADMIN_IDS: FrozenSet[int] = Field(default=frozenset(), description="Comma-separated admin user IDs")
     
     # Bot Behavior
     MAX_CONNECTIONS: int = Field(default=100, description="Maximum concurrent connections")
     WEBHOOK_MODE: bool = Field(default=False, description="Enable webhook mode")
     
+    @cached_property
+    def all_admin_ids(self) -> FrozenSet[int]:
+        """Owner ID plus configured admin IDs, built once."""
+        return self.ADMIN_IDS | {self.OWNER_ID}
+
     @computed_field
-    @property
+    @cached_property
     def admin_list(self) -> List[int]:
-        """Parse admin IDs from comma-separated string."""
-        if not self.ADMIN_IDS:
-            return [self.OWNER_ID]
-        
-        admin_ids = [self.OWNER_ID]
-        for admin_id in self.ADMIN_IDS.split(","):
-            try:
-                admin_ids.append(int(admin_id.strip()))
-            except ValueError:
-                continue
-        return list(set(admin_ids))
+        """Owner ID plus configured admin IDs, deduplicated."""
+        return list(self.all_admin_ids)
+
+    def is_admin(self, user_id: int) -> bool:
+        """
+        Check whether a user is the owner or a configured admin.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            True if the user has admin rights
+        """
+        return user_id in self.all_admin_ids
+
+    def is_owner(self, user_id: int) -> bool:
+        """
+        Check whether a user is the bot owner.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            True if the user is the owner
+        """
+        return user_id == self.OWNER_ID
 
     # ========================================================================
     # DATABASE CONFIGURATION
@@ -89,7 +341,59 @@ class Settings(BaseSettings):
     DB_MAX_OVERFLOW: int = Field(default=10, description="Maximum pool overflow")
     DB_POOL_TIMEOUT: int = Field(default=30, description="Pool timeout in seconds")
     DB_POOL_RECYCLE: int = Field(default=3600, description="Connection recycle time")
+    DB_PING_IDLE_SECONDS: int = Field(
+        default=300,
+        description="Ping a pooled connection on checkout only after this many idle seconds"
+    )
+    DB_POOL_USE_LIFO: bool = Field(
+        default=True,
+        description="Reuse the most recently returned pooled connection first"
+    )
+    DB_PING_TTL: float = Field(
+        default=5.0,
+        description="Seconds a successful connection check is reused before probing again"
+    )
+    DB_STATEMENT_CACHE_SIZE: int = Field(
+        default=1024,
+        description="asyncpg prepared statement cache size per connection (0 behind PgBouncer)"
+    )
+    DB_STRICT_PREPING: bool = Field(
+        default=False,
+        description="Ping every pooled connection on checkout (one extra round-trip each)"
+    )
     DB_ECHO: bool = Field(default=False, description="Echo SQL queries")
+    DB_TRACE_POOL: bool = Field(
+        default=False,
+        description="Log pool connect/checkout/checkin events (debug only)"
+    )
+    
+    @cached_property
+    def database(self) -> DatabaseSettings:
+        """Database connection settings for the connection manager, built once."""
+        if self.DB_TYPE == "sqlite":
+            url = f"sqlite+aiosqlite:///{self.DB_NAME}.db"
+        else:
+            url = (
+                f"postgresql+asyncpg://{quote(self.DB_USER, safe='')}:"
+                f"{quote(self.DB_PASSWORD, safe='')}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+            )
+        return DatabaseSettings(
+            url=url,
+            host=self.DB_HOST,
+            port=self.DB_PORT,
+            name=self.DB_NAME,
+            echo=self.DB_ECHO,
+            pool_size=self.DB_POOL_SIZE,
+            max_overflow=self.DB_MAX_OVERFLOW,
+            pool_timeout=self.DB_POOL_TIMEOUT,
+            pool_recycle=self.DB_POOL_RECYCLE,
+            strict_preping=self.DB_STRICT_PREPING,
+            statement_cache_size=self.DB_STATEMENT_CACHE_SIZE,
+            pool_use_lifo=self.DB_POOL_USE_LIFO,
+            ping_idle_seconds=self.DB_PING_IDLE_SECONDS,
+            ping_ttl=self.DB_PING_TTL,
+            trace_pool=self.DB_TRACE_POOL,
+        )
     
     # MongoDB Settings (Alternative)
     MONGO_URI: Optional[str] = Field(None, description="MongoDB connection URI")
@@ -185,10 +489,9 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         v = v.upper()
-        if v not in valid_levels:
-            raise ValueError(f"Invalid log level. Must be one of: {valid_levels}")
+        if v not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level. Must be one of: {sorted(_VALID_LOG_LEVELS)}")
         return v
 
     # ========================================================================
@@ -215,15 +518,13 @@ class Settings(BaseSettings):
     
     # API Keys
     API_KEY_HEADER: str = Field(default="X-API-Key", description="API key header name")
-    API_KEYS: str = Field(default="", description="Comma-separated API keys")
+    API_KEYS: Tuple[str, ...] = Field(default=(), description="Comma-separated API keys")
 
     @computed_field
     @property
-    def api_keys_list(self) -> List[str]:
-        """Parse API keys from comma-separated string."""
-        if not self.API_KEYS:
-            return []
-        return [key.strip() for key in self.API_KEYS.split(",") if key.strip()]
+    def api_keys_list(self) -> Tuple[str, ...]:
+        """Configured API keys."""
+        return self.API_KEYS
 
     # ========================================================================
     # USER LIMITS & QUOTAS
@@ -255,9 +556,9 @@ class Settings(BaseSettings):
     WEBHOOK_SSL_PRIV: Optional[str] = Field(None, description="SSL private key path")
 
     @computed_field
-    @property
+    @cached_property
     def webhook_url(self) -> Optional[str]:
-        """Generate full webhook URL."""
+        """Full webhook URL, built once on first access."""
         if self.WEBHOOK_HOST and self.BOT_TOKEN:
             path = self.WEBHOOK_PATH.format(token=self.BOT_TOKEN)
             return f"{self.WEBHOOK_HOST}{path}"
@@ -276,17 +577,15 @@ class Settings(BaseSettings):
     
     # CORS
     CORS_ENABLED: bool = Field(default=True, description="Enable CORS")
-    CORS_ORIGINS: str = Field(default="*", description="CORS allowed origins")
-    CORS_METHODS: str = Field(default="GET,POST,PUT,DELETE", description="CORS methods")
-    CORS_HEADERS: str = Field(default="*", description="CORS headers")
+    CORS_ORIGINS: Tuple[str, ...] = Field(default=_DEFAULT_CORS_ORIGINS, description="CORS allowed origins")
+    CORS_METHODS: Tuple[str, ...] = Field(default=_DEFAULT_CORS_METHODS, description="CORS methods")
+    CORS_HEADERS: Tuple[str, ...] = Field(default=_DEFAULT_CORS_HEADERS, description="CORS headers")
 
     @computed_field
     @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins."""
-        if self.CORS_ORIGINS == "*":
-            return ["*"]
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """Configured CORS origins."""
+        return self.CORS_ORIGINS
 
     # ========================================================================
     # BACKUP & MAINTENANCE
@@ -372,13 +671,16 @@ class Settings(BaseSettings):
     TIMEZONE: str = Field(default="UTC", description="Application timezone")
     DATE_FORMAT: str = Field(default="%Y-%m-%d %H:%M:%S", description="Date format")
     DEFAULT_LANGUAGE: str = Field(default="en", description="Default language")
-    SUPPORTED_LANGUAGES: str = Field(default="en,ru,es,fr,de", description="Supported languages")
+    SUPPORTED_LANGUAGES: Tuple[str, ...] = Field(
+        default=_DEFAULT_SUPPORTED_LANGUAGES,
+        description="Supported languages"
+    )
 
     @computed_field
     @property
-    def supported_languages_list(self) -> List[str]:
-        """Parse supported languages."""
-        return [lang.strip() for lang in self.SUPPORTED_LANGUAGES.split(",")]
+    def supported_languages_list(self) -> Tuple[str, ...]:
+        """Supported language codes."""
+        return self.SUPPORTED_LANGUAGES
 
     # ========================================================================
     # RENDER SPECIFIC SETTINGS
@@ -410,14 +712,66 @@ class Settings(BaseSettings):
     EXPERIMENTAL_FEATURES: bool = Field(default=False, description="Experimental features")
     BETA_FEATURES: bool = Field(default=False, description="Beta features")
 
+    @cached_property
+    def features(self) -> Feature:
+        """Enabled feature flags packed into a single bitfield."""
+        features = Feature(0)
+        for feature, field_name in _FEATURE_FIELDS.items():
+            if getattr(self, field_name):
+                features |= feature
+        return features
+
+    def _field_values(self) -> Tuple[Any, ...]:
+        """Field values in declaration order; every field type is hashable."""
+        return tuple(map(self.__dict__.__getitem__, self.model_fields))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare field values only.
+
+        Pydantic's default also compares cached property values, so two
+        instances with the same fields differ depending on what was read.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._field_values() == other._field_values()
+
+    def __hash__(self) -> int:
+        """
+        Hash by field values, consistent with ``__eq__``, so settings can
+        key downstream caches.
+
+        Returns:
+            Hash of the field values
+        """
+        return hash(self._field_values())
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ) -> "Settings":
+        """
+        Copy the settings, dropping cached values derived from the original.
+
+        Args:
+            update: Field values to change in the copy
+            deep: Deep-copy field values
+
+        Returns:
+            New Settings instance
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _CACHED_PROPERTIES:
+            copied.__dict__.pop(name, None)
+        return copied
+
     # ========================================================================
     # COMPUTED PROPERTIES
     # ========================================================================
 
     @computed_field
-    @property
+    @cached_property
     def is_production(self) -> bool:
-        """Check if running in production mode."""
+        """Check if running in production mode, evaluated once."""
         return not (self.DEBUG or self.DEV_MODE or self.TESTING)
 
     @computed_field
@@ -427,37 +781,127 @@ class Settings(BaseSettings):
         return Path(__file__).parent.parent
 
     @computed_field
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Get logs directory path."""
-        logs_path = self.base_dir / "logs"
-        logs_path.mkdir(exist_ok=True)
-        return logs_path
+        return self.base_dir / "logs"
 
     @computed_field
-    @property
+    @cached_property
     def backups_dir(self) -> Path:
         """Get backups directory path."""
-        backup_path = self.base_dir / self.BACKUP_PATH
-        backup_path.mkdir(exist_ok=True)
-        return backup_path
+        return self.base_dir / self.BACKUP_PATH
+
+    @model_validator(mode="after")
+    def create_directories(self) -> "Settings":
+        """
+        Create the directories used by enabled features, once, at load time.
+
+        The logs directory is always needed for ``errors.log``; the backups
+        directory only when auto backup is on. Shared paths are created once.
+        """
+        directories = {self.logs_dir}
+        if self.AUTO_BACKUP_ENABLED:
+            directories.add(self.backups_dir)
+        for directory in directories:
+            directory.mkdir(exist_ok=True)
+        return self
+
+    # ========================================================================
+    # SERIALIZATION
+    # ========================================================================
+
+    def to_dict(self, exclude_secrets: bool = True) -> Dict[str, Any]:
+        """
+        Convert settings to a dictionary.
+
+        Args:
+            exclude_secrets: Leave out tokens, passwords, keys and URLs that
+                can carry credentials
+
+        Returns:
+            JSON-compatible settings dictionary
+        """
+        return self.model_dump(
+            mode="json",
+            exclude=_SECRET_FIELDS if exclude_secrets else None
+        )
+
+    def to_json(self, exclude_secrets: bool = True) -> str:
+        """
+        Serialize settings straight to a JSON string.
+
+        Args:
+            exclude_secrets: Leave out tokens, passwords, keys and URLs that
+                can carry credentials
+
+        Returns:
+            Settings as JSON
+        """
+        return self.model_dump_json(exclude=_SECRET_FIELDS if exclude_secrets else None)
+
+
+# Values derived from fields and cached on the instance; model_copy()
+# drops them so a copy never reports the original's values
+_CACHED_PROPERTIES: FrozenSet[str] = frozenset(
+    name for name, attr in vars(Settings).items() if isinstance(attr, cached_property)
+)
+
+# Settings that must not appear in dumps, resolved once at import. URL,
+# URI and DSN fields may carry credentials in their userinfo (MONGO_URI,
+# SENTRY_DSN); key names like API_KEY_HEADER are not secrets. The computed
+# webhook URL embeds the bot token and api_keys_list mirrors API_KEYS.
+_SECRET_NAME = re.compile(
+    r"password|secret|token|keys?$|_(?:url|uri|dsn)$", re.IGNORECASE
+).search
+_SECRET_FIELDS: FrozenSet[str] = frozenset(
+    name for name in Settings.model_fields if _SECRET_NAME(name)
+) | {"webhook_url", "api_keys_list"}
 
 
 # ============================================================================
 # SETTINGS SINGLETON
 # ============================================================================
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Get cached settings instance.
-    
+
+    The first call reads the environment and ``.env``; every later call
+    returns the same object. The environment is not part of the cache key,
+    so tests that mutate ``os.environ`` must call ``clear_settings_cache()``
+    afterwards to pick up the new values.
+
     Returns:
         Settings instance
     """
     return Settings()
 
 
+def clear_settings_cache() -> None:
+    """Drop the cached settings instance and environment snapshot."""
+    _environ_snapshot.cache_clear()
+    get_settings.cache_clear()
+
+
+def fast_reload_settings(values: Mapping[str, Any]) -> Settings:
+    """
+    Rebuild settings from already-validated values without re-validating.
+
+    Intended for workers and subprocesses that receive the values of a
+    settings instance that was validated once, e.g. ``settings.model_dump()``.
+    Validators are skipped, so never pass unchecked input here.
+
+    Args:
+        values: Field values from a validated Settings instance
+
+    Returns:
+        Settings instance
+    """
+    return Settings.model_construct(**values)
+
+
 # ============================================================================
 # END OF SETTINGS MODULE
 # ============================================================================
@@ -12,6 +12,7 @@ License: MIT
 
 from database.manager import DatabaseManager
 from database.models import User, MonitoredLink, PingLog, Alert, UserLog, Statistics
+from database.repositories import UserRepository, LinkRepository
 
 __all__ = [
     "DatabaseManager",
@@ -21,5 +22,7 @@ __all__ = [
     "Alert",
     "UserLog",
     "Statistics",
+    "UserRepository",
+    "LinkRepository",
 ]
 
@@ -8,11 +8,14 @@ using SQLAlchemy's async engine and session maker.
 from __future__ import annotations
 
 import asyncio
+import time
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, Optional, Type
+from datetime import datetime, timedelta
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Dict, Optional, Set, Type
 import logging
 
-from sqlalchemy import event, text
+from sqlalchemy import delete, event, func, select, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -20,9 +23,11 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine
 )
 from sqlalchemy.pool import NullPool, QueuePool
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DisconnectionError, SQLAlchemyError
+from sqlalchemy.util import LRUCache
 
-from config import settings, DatabaseSettings
+from config import get_settings, DatabaseSettings
+from database.models import Alert, MonitoredLink, PingLog, User, UserLog
 from exceptions import (
     DatabaseConnectionError,
     DatabaseQueryError,
@@ -33,6 +38,38 @@ from exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Shared so the compiled form is cached once and reused by every probe
+_PING = text("SELECT 1")
+
+# Both log deletes and the combined count in one PostgreSQL round-trip
+_CLEANUP_LOGS = text(
+    f"WITH p AS (DELETE FROM {PingLog.__tablename__} "
+    f"WHERE created_at < :cutoff RETURNING 1), "
+    f"u AS (DELETE FROM {UserLog.__tablename__} "
+    f"WHERE created_at < :cutoff RETURNING 1) "
+    f"SELECT (SELECT count(*) FROM p) + (SELECT count(*) FROM u)"
+)
+
+# Row counts for get_database_info(), built once at import
+_TABLE_COUNTS = select(
+    select(func.count()).select_from(User).scalar_subquery().label("users"),
+    select(func.count()).select_from(MonitoredLink).scalar_subquery().label("links"),
+    select(func.count()).select_from(PingLog).scalar_subquery().label("logs"),
+    select(func.count()).select_from(Alert).scalar_subquery().label("alerts"),
+)
+
+# Compiled statements kept by the engine; least recently used are evicted
+_COMPILED_CACHE_SIZE = 1024
+
+# Read-only sessions closed off the request path at any one time; beyond
+# this the caller awaits close() itself
+_MAX_BACKGROUND_CLOSES = 64
+
+# Session opened by the outermost session() scope of the current task
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "current_session", default=None
+)
+
 
 class DatabaseManager:
     """
@@ -48,7 +85,6 @@ class DatabaseManager:
     """
     
     _instance: Optional["DatabaseManager"] = None
-    _lock: asyncio.Lock = asyncio.Lock()
     
     def __new__(cls) -> "DatabaseManager":
         """Implement singleton pattern."""
@@ -65,9 +101,34 @@ class DatabaseManager:
         self.engine: Optional[AsyncEngine] = None
         self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self.is_connected: bool = False
-        self._settings: DatabaseSettings = settings.database
+        self._lock: Optional[asyncio.Lock] = None
+        self._connecting: bool = False
+        self._connection_ready: Optional[asyncio.Event] = None
+        self._settings: DatabaseSettings = get_settings().database
+        self._is_sqlite: bool = self._settings.url.startswith(("sqlite://", "sqlite+"))
+        self._is_postgres: bool = self._settings.url.startswith("postgresql")
+        self._compiled_cache: LRUCache = LRUCache(_COMPILED_CACHE_SIZE)
+        self._session_kwargs: Dict[str, Any] = {}
+        self._pending_closes: Set[asyncio.Task] = set()
+        self._engine_kwargs: Dict[str, Any] = self._get_engine_kwargs()
+        self._last_ok_ts: float = 0.0
+        self._ping_ttl: float = self._settings.ping_ttl
         self._initialized = True
     
+    def _get_lock(self) -> asyncio.Lock:
+        """
+        Get the connect/disconnect lock, creating it on first use.
+        
+        Created lazily from inside a coroutine so it belongs to the running
+        event loop rather than whichever loop existed at import time.
+        
+        Returns:
+            Manager lock
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+    
     async def connect(self) -> None:
         """
         Establish database connection.
@@ -78,65 +139,93 @@ class DatabaseManager:
             DatabaseConnectionError: If connection fails
             InitializationError: If already connected
         """
-        async with self._lock:
+        # Fast path: no lock needed once the engine exists
+        if self.is_connected:
+            return
+        
+        # The lock only guards the decision to connect; the network work
+        # below runs outside it, and concurrent callers wait on an event
+        async with self._get_lock():
             if self.is_connected:
                 logger.warning("Database already connected")
                 return
             
-            try:
-                logger.info("Connecting to database...")
-                
-                # Create engine with appropriate settings
-                engine_kwargs = self._get_engine_kwargs()
-                
-                self.engine = create_async_engine(
-                    self._settings.url,
-                    **engine_kwargs
-                )
-                
-                # Create session factory
-                self.session_factory = async_sessionmaker(
-                    bind=self.engine,
-                    class_=AsyncSession,
-                    expire_on_commit=False,
-                    autocommit=False,
-                    autoflush=False
-                )
-                
-                # Test connection
-                await self._test_connection()
-                
-                # Set up event listeners
-                self._setup_event_listeners()
-                
-                self.is_connected = True
-                logger.info("Database connection established successfully")
-                
-            except SQLAlchemyError as e:
-                error_msg = f"Failed to connect to database: {str(e)}"
-                logger.error(error_msg)
-                raise DatabaseConnectionError(
-                    message=error_msg,
-                    host=self._settings.host,
-                    port=self._settings.port,
-                    database=self._settings.name,
-                    cause=e
-                )
+            waiting = self._connecting
+            if not waiting:
+                self._connecting = True
+                self._connection_ready = asyncio.Event()
+            ready = self._connection_ready
+        
+        if waiting:
+            await ready.wait()
+            if not self.is_connected:
+                raise DatabaseConnectionError("Database connection failed")
+            return
+        
+        try:
+            logger.info("Connecting to database...")
+            
+            # Create engine with the settings resolved in __init__
+            self.engine = create_async_engine(
+                self._settings.url,
+                **self._engine_kwargs
+            )
+            self._setup_idle_ping()
+            
+            # Create session factory; autoflush lets pending changes go out
+            # with the next query or the commit instead of manual flushes
+            self.session_factory = async_sessionmaker(
+                bind=self.engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+            # session() builds AsyncSession directly from these, skipping
+            # the factory's per-call kwargs merge
+            self._session_kwargs = {"bind": self.engine, "expire_on_commit": False}
+            
+            # Test connection and open the pool before traffic arrives
+            await self._test_connection()
+            await self._warm_pool()
+            
+            # Set up event listeners
+            self._setup_event_listeners()
+            
+            self.is_connected = True
+            logger.info("Database connection established successfully")
+            
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to connect to database: {str(e)}"
+            logger.error(error_msg)
+            raise DatabaseConnectionError(
+                message=error_msg,
+                host=self._settings.host,
+                port=self._settings.port,
+                database=self._settings.name,
+                cause=e
+            )
+            
+        finally:
+            self._connecting = False
+            ready.set()
     
     def _get_engine_kwargs(self) -> Dict[str, Any]:
         """
         Get engine configuration kwargs based on settings.
         
+        Called once from ``__init__``; settings do not change afterwards.
+        
         Returns:
             Dictionary of engine configuration options
         """
         kwargs: Dict[str, Any] = {
             "echo": self._settings.echo,
             "echo_pool": self._settings.echo_pool,
+            # Reuse compiled SQL for repeated statements across sessions
+            "execution_options": {"compiled_cache": self._compiled_cache},
         }
         
         # Use NullPool for SQLite, QueuePool for others
-        if "sqlite" in self._settings.url:
+        if self._is_sqlite:
             kwargs["poolclass"] = NullPool
         else:
             kwargs["poolclass"] = QueuePool
@@ -144,7 +233,25 @@ class DatabaseManager:
             kwargs["max_overflow"] = self._settings.max_overflow
             kwargs["pool_timeout"] = self._settings.pool_timeout
             kwargs["pool_recycle"] = self._settings.pool_recycle
-            kwargs["pool_pre_ping"] = self._settings.pool_pre_ping
+            # LIFO keeps a small hot set of connections busy and lets the
+            # overflow ones idle out
+            kwargs["pool_use_lifo"] = self._settings.pool_use_lifo
+            # Pre-ping costs a round-trip per checkout; recycling below the
+            # server idle timeout plus TCP keepalives covers stale
+            # connections, so it is opt-in via DB_STRICT_PREPING
+            kwargs["pool_pre_ping"] = self._settings.strict_preping
+            if self._settings.url.startswith("postgresql+asyncpg"):
+                # Prepared statements are parsed once per connection; a
+                # size of 0 turns caching off for PgBouncer transaction mode
+                cache_size = self._settings.statement_cache_size
+                kwargs["connect_args"] = {
+                    "statement_cache_size": cache_size,
+                    "prepared_statement_cache_size": cache_size,
+                    "server_settings": {
+                        "tcp_keepalives_idle": "60",
+                        "jit": "off",
+                    },
+                }
         
         return kwargs
     
@@ -157,7 +264,7 @@ class DatabaseManager:
         """
         try:
             async with self.engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_PING)
                 await conn.commit()
                 
         except SQLAlchemyError as e:
@@ -166,8 +273,74 @@ class DatabaseManager:
                 cause=e
             )
     
+    async def _warm_pool(self) -> None:
+        """
+        Open ``pool_size`` connections up front.
+        
+        Checking them out concurrently means the first burst of real
+        queries finds ready connections instead of paying for the
+        TCP/TLS handshake and authentication. Best-effort: the connection
+        test already passed, so a failed warm-up connection is only logged
+        and the pool opens it on demand later.
+        """
+        if self._is_sqlite:
+            return
+        
+        async def _checkout() -> None:
+            async with self.engine.connect() as conn:
+                await conn.execute(_PING)
+        
+        results = await asyncio.gather(
+            *(_checkout() for _ in range(self._settings.pool_size)),
+            return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning(
+                f"Pool warm-up opened {len(results) - len(failures)}/{len(results)} "
+                f"connections; first error: {failures[0]}"
+            )
+    
+    def _setup_idle_ping(self) -> None:
+        """
+        Ping pooled connections on checkout only after they sat idle.
+        
+        A cheaper alternative to ``pool_pre_ping`` when DB_STRICT_PREPING is
+        off: connections returned recently are handed out as-is, and ones
+        idle longer than ``ping_idle_seconds`` get one ``SELECT 1``. A failed
+        ping makes the pool discard the connection and open a new one.
+        """
+        if self._is_sqlite or self._settings.strict_preping:
+            return
+        
+        idle_limit = self._settings.ping_idle_seconds
+        dialect = self.engine.dialect
+        
+        @event.listens_for(self.engine.sync_engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            connection_record.info["last_used"] = time.monotonic()
+        
+        @event.listens_for(self.engine.sync_engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            last_used = connection_record.info.get("last_used")
+            if last_used is None or time.monotonic() - last_used < idle_limit:
+                return
+            try:
+                dialect.do_ping(dbapi_connection)
+            except Exception as e:
+                raise DisconnectionError(f"Idle connection failed ping: {e}") from e
+    
     def _setup_event_listeners(self) -> None:
-        """Set up SQLAlchemy event listeners for monitoring."""
+        """
+        Set up SQLAlchemy event listeners for monitoring.
+        
+        The listeners sit on the pool checkout/checkin hot path, so they
+        are only registered when pool tracing is switched on and DEBUG
+        logging is enabled; otherwise every checkout would pay for a
+        callback that logs nothing.
+        """
+        if not self._settings.trace_pool or not logger.isEnabledFor(logging.DEBUG):
+            return
         
         @event.listens_for(self.engine.sync_engine, "connect")
         def on_connect(dbapi_connection, connection_record):
@@ -187,7 +360,12 @@ class DatabaseManager:
         
         Disposes of the engine and cleans up resources.
         """
-        async with self._lock:
+        # Fast path: nothing to tear down, so skip the lock
+        if not self.is_connected:
+            logger.warning("Database not connected")
+            return
+        
+        async with self._get_lock():
             if not self.is_connected:
                 logger.warning("Database not connected")
                 return
@@ -195,6 +373,11 @@ class DatabaseManager:
             try:
                 logger.info("Disconnecting from database...")
                 
+                if self._pending_closes:
+                    await asyncio.gather(
+                        *self._pending_closes, return_exceptions=True
+                    )
+                
                 if self.engine:
                     await self.engine.dispose()
                     self.engine = None
@@ -209,12 +392,30 @@ class DatabaseManager:
                 raise
     
     @asynccontextmanager
-    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+    async def session(self, readonly: bool = False) -> AsyncGenerator[AsyncSession, None]:
         """
         Context manager for database sessions.
         
-        Provides a session that is automatically committed on success
-        or rolled back on failure.
+        Provides a session inside a transaction that is committed on
+        success or rolled back on failure. Callers should flush, not commit.
+        
+        Nested calls within the same task reuse the outer session inside a
+        SAVEPOINT instead of opening a new one; the outer scope commits and
+        closes it. Tasks spawned inside a scope inherit the context but not
+        the session: an AsyncSession must not be shared between tasks, so
+        they open their own.
+        
+        A write scope nested in a read-only one opens a fresh session of
+        its own instead: the read-only transaction would never commit its
+        changes. It commits independently of the enclosing scope.
+        
+        Read-only sessions never commit: the transaction is rolled back when
+        the session closes, and on PostgreSQL it is opened READ ONLY. After
+        a clean exit they are closed in the background, so releasing the
+        connection does not add to the caller's latency.
+        
+        Args:
+            readonly: Skip the COMMIT for sessions that only read
         
         Yields:
             AsyncSession: Database session
@@ -226,14 +427,48 @@ class DatabaseManager:
         if not self.is_connected or not self.session_factory:
             raise DatabaseConnectionError("Database not connected")
         
-        session = self.session_factory()
+        current = _current_session.get()
+        if (
+            current is not None
+            and current.info["task"] is asyncio.current_task()
+            and (readonly or not current.info["readonly"])
+        ):
+            try:
+                if readonly:
+                    yield current
+                else:
+                    async with current.begin_nested():
+                        yield current
+            except SQLAlchemyError as e:
+                logger.error(f"Database session error: {e}")
+                raise DatabaseQueryError(
+                    message=str(e),
+                    cause=e
+                )
+            return
+        
+        session = AsyncSession(**self._session_kwargs)
+        session.info["task"] = asyncio.current_task()
+        session.info["readonly"] = readonly
+        token = _current_session.set(session)
+        close_later = False
         
         try:
-            yield session
-            await session.commit()
+            if readonly:
+                if self._is_postgres:
+                    await session.connection(
+                        execution_options={"postgresql_readonly": True}
+                    )
+                # close() below rolls the transaction back
+                yield session
+                close_later = len(self._pending_closes) < _MAX_BACKGROUND_CLOSES
+                return
+            
+            # Commit happens on exit, in the same round-trip as the last flush
+            async with session.begin():
+                yield session
             
         except SQLAlchemyError as e:
-            await session.rollback()
             logger.error(f"Database session error: {e}")
             raise DatabaseQueryError(
                 message=str(e),
@@ -241,49 +476,258 @@ class DatabaseManager:
             )
             
         finally:
-            await session.close()
+            _current_session.reset(token)
+            if close_later:
+                self._close_in_background(session)
+            else:
+                await session.close()
+    
+    def _close_in_background(self, session: AsyncSession) -> None:
+        """
+        Close a session in a tracked background task.
+        
+        Args:
+            session: Session to close
+        """
+        task = asyncio.create_task(session.close())
+        self._pending_closes.add(task)
+        task.add_done_callback(self._on_close_done)
+    
+    def _on_close_done(self, task: asyncio.Task) -> None:
+        """
+        Forget a finished background close and log its failure, if any.
+        
+        Args:
+            task: Finished close task
+        """
+        self._pending_closes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background session close failed: {task.exception()}")
     
     @asynccontextmanager
     async def transaction(self) -> AsyncGenerator[AsyncSession, None]:
         """
         Context manager for explicit transactions.
         
-        Use when you need explicit control over commit/rollback.
+        Alias of :meth:`session`, which already wraps its body in a single
+        transaction.
         
         Yields:
             AsyncSession: Database session with active transaction
         """
+        async with self.session() as session:
+            yield session
+    
+    async def execute(self, statement: Any) -> Any:
+        """
+        Execute a SQL statement directly.
+        
+        Args:
+            statement: SQL statement to execute
+            
+        Returns:
+            Query result
+        """
+        async with self.session() as session:
+            result = await session.execute(statement)
+            return result
+    
+    async def stream_scalars(
+        self,
+        statement: Any,
+        yield_per: int = 500
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Iterate over the scalar results of a SELECT in batches.
+        
+        Rows are fetched ``yield_per`` at a time from a server-side cursor,
+        so large listings that are walked once are never materialised as a
+        full list. The stream uses its own session, which is not shared with
+        :meth:`session` calls made while iterating, and is never committed.
+        
+        Consume it inside ``contextlib.aclosing()`` so the session is closed
+        as soon as the loop exits, including on errors and early breaks.
+        
+        Args:
+            statement: SELECT statement to run
+            yield_per: Number of rows fetched per batch
+            
+        Yields:
+            One scalar (usually an ORM object) per row
+            
+        Raises:
+            DatabaseConnectionError: If not connected
+            DatabaseQueryError: If query fails
+        """
         if not self.is_connected or not self.session_factory:
             raise DatabaseConnectionError("Database not connected")
         
-        session = self.session_factory()
-        
         try:
-            async with session.begin():
-                yield session
-                
+            async with AsyncSession(**self._session_kwargs) as session:
+                result = await session.stream_scalars(
+                    statement.execution_options(yield_per=yield_per)
+                )
+                async for item in result:
+                    yield item
+                    
         except SQLAlchemyError as e:
-            logger.error(f"Transaction error: {e}")
+            logger.error(f"Database stream error: {e}")
             raise DatabaseQueryError(
                 message=str(e),
                 cause=e
             )
+    
+    async def check_connection(self, force: bool = False) -> bool:
+        """
+        Check that the database answers queries.
+        
+        A success within the last ``ping_ttl`` seconds is reused, so
+        frequent health checks do not each cost a round-trip.
+        
+        Args:
+            force: Always probe the database
             
-        finally:
-            await session.close()
+        Returns:
+            True if the database is reachable
+        """
+        if not self.is_connected or not self.engine:
+            return False
+        
+        if not force and time.monotonic() - self._last_ok_ts < self._ping_ttl:
+            return True
+        
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(_PING)
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Database connection check failed: {e}")
+            self._last_ok_ts = 0.0
+            return False
+        
+        self._last_ok_ts = time.monotonic()
+        return True
     
-    async def execute(self, statement: Any) -> Any:
+    async def cleanup_old_logs(self, days: int = 30) -> int:
         """
-        Execute a SQL statement directly.
+        Delete ping and user logs older than the retention window.
+        
+        On PostgreSQL both deletes and the count run as one CTE statement;
+        other databases fall back to two DELETEs in the same transaction.
         
         Args:
-            statement: SQL statement to execute
+            days: Retention period in days
             
         Returns:
-            Query result
+            Number of deleted rows
         """
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        
         async with self.session() as session:
-            result = await session.execute(statement)
-            return result
+            if self._is_postgres:
+                result = await session.execute(_CLEANUP_LOGS, {"cutoff": cutoff})
+                return result.scalar_one()
+            
+            ping_logs = await session.execute(
+                delete(PingLog).where(PingLog.created_at < cutoff)
+            )
+            user_logs = await session.execute(
+                delete(UserLog).where(UserLog.created_at < cutoff)
+            )
+            return ping_logs.rowcount + user_logs.rowcount
+    
+    async def execute_scalar(
+        self,
+        sql: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Run a raw SQL statement on a pooled connection and return one value.
+        
+        Bypasses the ORM session and its commit, for read-only probes such
+        as health checks and counters.
+        
+        Args:
+            sql: SQL text
+            params: Bound parameters
+            
+        Returns:
+            First column of the first row, or None
+            
+        Raises:
+            DatabaseConnectionError: If not connected
+            DatabaseQueryError: If query fails
+        """
+        if not self.is_connected or not self.engine:
+            raise DatabaseConnectionError("Database not connected")
+        
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(text(sql), params or {})
+                return result.scalar()
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Database query error: {e}")
+            raise DatabaseQueryError(
+                message=str(e),
+                cause=e
+            )
     
+    async def estimate_count(self, model: Type[Any]) -> int:
+        """
+        Get an approximate row count for a model's table.
+        
+        On PostgreSQL the planner's estimate is read from ``pg_class``
+        instead of scanning the table; other backends, and tables that have
+        never been analysed, fall back to an exact COUNT(*).
+        
+        Args:
+            model: Mapped model class
+            
+        Returns:
+            Estimated number of rows
+            
+        Raises:
+            DatabaseConnectionError: If not connected
+            DatabaseQueryError: If query fails
+        """
+        if self._is_postgres:
+            estimate = await self.execute_scalar(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table)",
+                {"table": model.__tablename__}
+            )
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+        
+        async with self.session(readonly=True) as session:
+            return await session.scalar(
+                select(func.count()).select_from(model)
+            ) or 0
     
+    async def get_database_info(self) -> Dict[str, Any]:
+        """
+        Get row counts for the main tables.
+        
+        All four counts are scalar subqueries of one SELECT, so the
+        summary costs a single round-trip.
+        
+        Returns:
+            Dictionary with status, users, links, logs, alerts and checked_at
+        """
+        try:
+            async with self.session(readonly=True) as session:
+                row = (await session.execute(_TABLE_COUNTS)).one()
+                
+            return {
+                "status": "connected",
+                **row._asdict(),
+                "checked_at": datetime.utcnow().isoformat(),
+            }
+            
+        except (DatabaseConnectionError, DatabaseQueryError) as e:
+            logger.error(f"Error getting database info: {e}")
+            return {
+                "status": "error",
+                "checked_at": datetime.utcnow().isoformat(),
+            }
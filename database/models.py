@@ -18,7 +18,7 @@ from decimal import Decimal
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Boolean, DateTime, Text,
     Float, JSON, Enum, ForeignKey, Index, UniqueConstraint,
-    CheckConstraint, Table, func, and_, or_
+    CheckConstraint, Table, func, and_, or_, text, update
 )
 from sqlalchemy.orm import relationship, declarative_base, declared_attr
 from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
@@ -313,6 +313,22 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
             self.last_command = command
         self.total_commands += 1
 
+    @classmethod
+    def activity_update(cls, user_id: int, command: Optional[str] = None):
+        """
+        Build a single server-side UPDATE recording user activity.
+
+        Same effect as update_activity() without loading the row first;
+        the counter is incremented atomically in the database.
+        """
+        values = {
+            "last_activity": func.now(),
+            "total_commands": cls.total_commands + 1,
+        }
+        if command:
+            values["last_command"] = command
+        return update(cls).where(cls.user_id == user_id).values(**values)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert user to dictionary"""
         return {
@@ -460,6 +476,12 @@ class MonitoredLink(Base, TimestampMixin, SoftDeleteMixin):
         Index('idx_link_next_check', 'next_check', 'is_active'),
         Index('idx_link_is_up', 'is_up', 'is_active'),
         Index('idx_link_monitor_type', 'monitor_type', 'status'),
+        # Due-link sweep: active, not deleted, ordered by next_check
+        Index(
+            'idx_link_due',
+            next_check.asc().nulls_first(),
+            postgresql_where=text('is_active AND NOT is_deleted'),
+        ),
     )
 
     @hybrid_property
@@ -0,0 +1,257 @@
+"""
+Database Repositories for Uptime Bot
+
+Query helpers for users and monitored links, used by the bot handlers
+and the monitoring engine. Each method opens its own short
+``DatabaseManager.session()`` scope, so no connection is held between
+calls.
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Type
+
+from sqlalchemy import and_, func, or_, select
+
+from database.connection import DatabaseManager
+from database.models import MonitoredLink, User, UserStatus
+
+
+class UserRepository:
+    """
+    User Repository
+
+    Looks up, creates and updates ``User`` rows by Telegram user ID.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            db_manager: Connected database manager
+        """
+        self.db_manager = db_manager
+
+    async def get_by_user_id(self, user_id: int) -> Optional[User]:
+        """
+        Get a user by Telegram user ID.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            The user, or None if unknown
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(
+                select(User).where(User.user_id == user_id)
+            )
+            return result.scalar_one_or_none()
+
+    async def get_or_create(
+        self,
+        user_id: int,
+        username: Optional[str] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        language_code: Optional[str] = None
+    ) -> User:
+        """
+        Get a user by Telegram user ID, creating the row on first contact.
+
+        Args:
+            user_id: Telegram user ID
+            username: Telegram username
+            first_name: First name
+            last_name: Last name
+            language_code: IETF language tag reported by Telegram
+
+        Returns:
+            The existing or newly created user
+        """
+        async with self.db_manager.session() as session:
+            result = await session.execute(
+                select(User).where(User.user_id == user_id)
+            )
+            user = result.scalar_one_or_none()
+            if user is None:
+                user = User(
+                    user_id=user_id,
+                    username=username,
+                    first_name=first_name,
+                    last_name=last_name,
+                    language_code=language_code or "en"
+                )
+                session.add(user)
+                await session.flush()
+            return user
+
+    async def update_activity(self, user_id: int, command: Optional[str] = None) -> bool:
+        """
+        Record activity for a user.
+
+        One UPDATE that increments the command counter in the database,
+        instead of loading the row and writing it back.
+
+        Args:
+            user_id: Telegram user ID
+            command: Last command the user sent
+
+        Returns:
+            True if the user exists
+        """
+        async with self.db_manager.session() as session:
+            result = await session.execute(User.activity_update(user_id, command))
+            return result.rowcount > 0
+
+    async def update(self, user: User) -> User:
+        """
+        Save changes made to a user loaded in an earlier session.
+
+        Args:
+            user: Detached user with pending changes
+
+        Returns:
+            The user attached to the session that saved it
+        """
+        async with self.db_manager.session() as session:
+            return await session.merge(user)
+
+    async def get_all(self, model: Type[Any], limit: int = 100, offset: int = 0) -> List[Any]:
+        """
+        Get a page of rows of a model.
+
+        Args:
+            model: ORM model class
+            limit: Maximum number of rows
+            offset: Number of rows to skip
+
+        Returns:
+            Rows in primary key order
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(
+                select(model).order_by(model.id).limit(limit).offset(offset)
+            )
+            return list(result.scalars())
+
+    async def count(self, model: Type[Any]) -> int:
+        """
+        Count the rows of a model.
+
+        Args:
+            model: ORM model class
+
+        Returns:
+            Exact row count
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(select(func.count()).select_from(model))
+            return result.scalar_one()
+
+    async def get_all_active(self) -> List[User]:
+        """
+        Get every active, non-deleted user.
+
+        Returns:
+            Active users
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(
+                select(User).where(
+                    and_(
+                        User.status == UserStatus.ACTIVE,
+                        User.is_deleted == False,
+                    )
+                )
+            )
+            return list(result.scalars())
+
+
+class LinkRepository:
+    """
+    Link Repository
+
+    Creates monitored links and selects the ones due for a check.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            db_manager: Connected database manager
+        """
+        self.db_manager = db_manager
+
+    async def get_user_links(self, user_id: int) -> List[MonitoredLink]:
+        """
+        Get the non-deleted links of a user.
+
+        Args:
+            user_id: Telegram user ID of the owner
+
+        Returns:
+            The user's links, oldest first
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(
+                select(MonitoredLink)
+                .join(User, MonitoredLink.user_id == User.id)
+                .where(
+                    and_(
+                        User.user_id == user_id,
+                        MonitoredLink.is_deleted == False,
+                    )
+                )
+                .order_by(MonitoredLink.id)
+            )
+            return list(result.scalars())
+
+    async def create(self, link: MonitoredLink) -> MonitoredLink:
+        """
+        Insert a new link.
+
+        Args:
+            link: Link to insert
+
+        Returns:
+            The inserted link with its primary key set
+        """
+        async with self.db_manager.session() as session:
+            session.add(link)
+            await session.flush()
+            return link
+
+    async def get_links_to_check(self, limit: int = 100) -> List[MonitoredLink]:
+        """
+        Get active links whose next check is due.
+
+        Links never checked (``next_check`` is NULL) come first, then the
+        most overdue; this matches the ``idx_link_due`` index.
+
+        Args:
+            limit: Maximum number of links
+
+        Returns:
+            Due links
+        """
+        async with self.db_manager.session(readonly=True) as session:
+            result = await session.execute(
+                select(MonitoredLink)
+                .where(
+                    and_(
+                        MonitoredLink.is_active == True,
+                        MonitoredLink.is_deleted == False,
+                        or_(
+                            MonitoredLink.next_check.is_(None),
+                            # Database clock, so the SQL text never changes
+                            MonitoredLink.next_check <= func.now(),
+                        ),
+                    )
+                )
+                .order_by(MonitoredLink.next_check.asc().nulls_first())
+                .limit(limit)
+            )
+            return list(result.scalars())
@@ -7,10 +7,20 @@ other exceptions inherit.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 from datetime import datetime
+from functools import cached_property
+import time
 import traceback
-import sys
+
+
+# Clock for exception timestamps, bound once so construction skips the
+# attribute lookup on the time module
+_time = time.time
+
+# Names of types reported by ConfigurationError; the same few builtins
+# come up from every config validation site
+_TYPE_NAME_CACHE: Dict[type, str] = {}
 
 
 class UptimeBotException(Exception):
@@ -40,6 +50,16 @@ class UptimeBotException(Exception):
     # Default admin notification
     default_notify_admin: bool = False
     
+    # Class name, set once per class for serialization
+    _type_name: str = "UptimeBotException"
+    _repr_prefix: str = "UptimeBotException(message="
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record per-class constants when a subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+        cls._repr_prefix = f"{cls.__name__}(message="
+    
     def __init__(
         self,
         message: str = "An error occurred",
@@ -62,27 +82,67 @@ class UptimeBotException(Exception):
         """
         super().__init__(message)
         
+        # One class lookup instead of three instance-then-MRO lookups
+        cls = type(self)
         self.message = message
-        self.error_code = error_code or self.default_error_code
-        self.details = details or {}
+        self.error_code = error_code or cls.default_error_code
+        # Copied so later detail writes never reach the caller's dict
+        self.details = dict(details) if details else {}
         self.cause = cause
-        self.recoverable = recoverable if recoverable is not None else self.default_recoverable
-        self.notify_admin = notify_admin if notify_admin is not None else self.default_notify_admin
-        self.timestamp = datetime.utcnow()
-        
-        # Capture traceback
-        self.traceback_str = self._capture_traceback()
+        # The cause never changes, so stringify it once while it is at hand
+        self._cause_str = str(cause) if cause is not None else None
+        self.recoverable = recoverable if recoverable is not None else cls.default_recoverable
+        self.notify_admin = notify_admin if notify_admin is not None else cls.default_notify_admin
+        self._timestamp_raw = _time()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Get when the exception occurred (UTC)."""
+        return datetime.utcfromtimestamp(self._timestamp_raw)
+    
+    def _set_detail(self, key: str, value: Any) -> None:
+        """
+        Set a single detail.
         
-        # Store the original exception info
-        self._exc_info = sys.exc_info()
+        Args:
+            key: Detail name
+            value: Detail value
+        """
+        self.details[key] = value
     
-    def _capture_traceback(self) -> str:
-        """Capture the current traceback as a string."""
-        return "".join(traceback.format_exception(*sys.exc_info()))
+    def _merge_details(self, values: Dict[str, Any]) -> None:
+        """
+        Merge several optional details in one update.
+        
+        Empty values (``None``, ``0``, ``""``, ``False``) are skipped, the
+        same test the constructors always applied to optional details.
+        Details that must be kept even when falsy are set with
+        :meth:`_set_detail` behind an ``is not None`` check instead.
+        
+        Args:
+            values: Detail names mapped to values
+        """
+        details = self.details
+        for key, value in values.items():
+            if value:
+                details[key] = value
     
     @property
+    def traceback_str(self) -> str:
+        """
+        Get the formatted traceback, built on access.
+        
+        Not cached: the traceback is only attached when the exception is
+        raised and grows as it propagates, so a string built earlier would
+        go stale. Exceptions that are never logged never walk their frames.
+        """
+        return "".join(
+            traceback.format_exception(type(self), self, self.__traceback__)
+        )
+    
+    @cached_property
     def full_message(self) -> str:
-        """Get full error message with code."""
+        """Get full error message with code, built once."""
         return f"[{self.error_code}] {self.message}"
     
     def to_dict(self) -> Dict[str, Any]:
@@ -93,37 +153,52 @@ class UptimeBotException(Exception):
             Dictionary representation of the exception
         """
         return {
-            "type": self.__class__.__name__,
+            "type": self._type_name,
             "message": self.message,
             "error_code": self.error_code,
             "details": self.details,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.utcfromtimestamp(self._timestamp_raw).isoformat(),
             "recoverable": self.recoverable,
             "notify_admin": self.notify_admin,
-            "cause": str(self.cause) if self.cause else None,
+            "cause": self._cause_str,
             "traceback": self.traceback_str if not self.recoverable else None
         }
     
-    def log_format(self) -> str:
+    def log_args(self) -> Tuple[str, Tuple[Any, ...]]:
         """
-        Format exception for logging.
+        Get a %-style format string and its arguments for logging.
+        
+        Passing these to the logger defers the formatting until a handler
+        actually emits the record::
+        
+            fmt, args = exc.log_args()
+            logger.error(fmt, *args)
         
         Returns:
-            Formatted string for logging
+            Tuple of (format string, arguments)
         """
-        parts = [
-            f"Exception: {self.__class__.__name__}",
-            f"Code: {self.error_code}",
-            f"Message: {self.message}"
-        ]
+        fmt = "Exception: %s | Code: %s | Message: %s"
+        args: Tuple[Any, ...] = (self._type_name, self.error_code, self.message)
         
         if self.details:
-            parts.append(f"Details: {self.details}")
+            fmt += " | Details: %s"
+            args += (self.details,)
+        
+        if self._cause_str is not None:
+            fmt += " | Cause: %s"
+            args += (self._cause_str,)
         
-        if self.cause:
-            parts.append(f"Cause: {self.cause}")
+        return fmt, args
+    
+    def log_format(self) -> str:
+        """
+        Format exception for logging.
         
-        return " | ".join(parts)
+        Returns:
+            Formatted string for logging
+        """
+        fmt, args = self.log_args()
+        return fmt % args
     
     def user_message(self) -> str:
         """
@@ -147,6 +222,23 @@ class UptimeBotException(Exception):
         self.details.update(kwargs)
         return self
     
+    def with_detail(self, key: str, value: Any) -> "UptimeBotException":
+        """
+        Add a single detail to the exception.
+        
+        Cheaper than :meth:`with_details` for one value, as no keyword
+        dict is built.
+        
+        Args:
+            key: Detail name
+            value: Detail value
+            
+        Returns:
+            Self for chaining
+        """
+        self._set_detail(key, value)
+        return self
+    
     @classmethod
     def from_exception(
         cls,
@@ -157,6 +249,9 @@ class UptimeBotException(Exception):
         """
         Create from another exception.
         
+        The new exception carries the original's traceback, so it points at
+        the real failure site even when built outside an ``except`` block.
+        
         Args:
             exception: The original exception
             message: Override message (uses original if not provided)
@@ -169,7 +264,7 @@ class UptimeBotException(Exception):
             message=message or str(exception),
             cause=exception,
             **kwargs
-        )
+        ).with_traceback(exception.__traceback__)
     
     def __str__(self) -> str:
         """String representation."""
@@ -177,12 +272,31 @@ class UptimeBotException(Exception):
     
     def __repr__(self) -> str:
         """Detailed string representation."""
-        return (
-            f"{self.__class__.__name__}("
-            f"message={self.message!r}, "
-            f"error_code={self.error_code}, "
-            f"details={self.details})"
-        )
+        return "".join((
+            self._repr_prefix,
+            repr(self.message),
+            ", error_code=",
+            str(self.error_code),
+            ", details=",
+            repr(self.details),
+            ")",
+        ))
+
+
+def _name_of_type(type_: type) -> str:
+    """
+    Get a type's name, cached per type.
+    
+    Args:
+        type_: Type to name
+        
+    Returns:
+        The type's ``__name__``
+    """
+    name = _TYPE_NAME_CACHE.get(type_)
+    if name is None:
+        name = _TYPE_NAME_CACHE.setdefault(type_, type_.__name__)
+    return name
 
 
 class UptimeBotError(UptimeBotException):
@@ -226,11 +340,10 @@ class ConfigurationError(UptimeBotException):
         """
         super().__init__(message, **kwargs)
         
-        if config_key:
-            self.details["config_key"] = config_key
-        
-        if expected_type:
-            self.details["expected_type"] = expected_type.__name__
+        self._merge_details({
+            "config_key": config_key,
+            "expected_type": _name_of_type(expected_type) if expected_type else None,
+        })
 
 
 class InitializationError(UptimeBotException):
@@ -262,7 +375,7 @@ class InitializationError(UptimeBotException):
         super().__init__(message, **kwargs)
         
         if component:
-            self.details["component"] = component
+            self._set_detail("component", component)
 
 
 class ShutdownError(UptimeBotException):
@@ -292,7 +405,7 @@ class ShutdownError(UptimeBotException):
         super().__init__(message, **kwargs)
         
         if component:
-            self.details["component"] = component
+            self._set_detail("component", component)
 
 
 class PermissionError(UptimeBotException):
@@ -312,7 +425,12 @@ class PermissionError(UptimeBotException):
         required_role: Optional[str] = None,
         user_role: Optional[str] = None,
         action: Optional[str] = None,
-        **kwargs: Any
+        *,
+        error_code: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None,
+        recoverable: Optional[bool] = None,
+        notify_admin: Optional[bool] = None
     ) -> None:
         """
         Initialize permission error.
@@ -322,18 +440,19 @@ class PermissionError(UptimeBotException):
             required_role: The role required for the action
             user_role: The user's current role
             action: The action that was denied
-            **kwargs: Additional arguments
+            error_code: Override the class default error code
+            details: Additional error details
+            cause: The underlying exception that caused this one
+            recoverable: Override the class default recoverability
+            notify_admin: Override the class default admin notification
         """
-        super().__init__(message, **kwargs)
+        super().__init__(message, error_code, details, cause, recoverable, notify_admin)
         
-        if required_role:
-            self.details["required_role"] = required_role
-        
-        if user_role:
-            self.details["user_role"] = user_role
-        
-        if action:
-            self.details["action"] = action
+        self._merge_details({
+            "required_role": required_role,
+            "user_role": user_role,
+            "action": action,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -358,7 +477,12 @@ class RateLimitError(UptimeBotException):
         retry_after: Optional[int] = None,
         limit: Optional[int] = None,
         window: Optional[int] = None,
-        **kwargs: Any
+        *,
+        error_code: Optional[int] = None,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None,
+        recoverable: Optional[bool] = None,
+        notify_admin: Optional[bool] = None
     ) -> None:
         """
         Initialize rate limit error.
@@ -368,20 +492,21 @@ class RateLimitError(UptimeBotException):
             retry_after: Seconds until the rate limit resets
             limit: The rate limit that was exceeded
             window: The time window for the rate limit
-            **kwargs: Additional arguments
+            error_code: Override the class default error code
+            details: Additional error details
+            cause: The underlying exception that caused this one
+            recoverable: Override the class default recoverability
+            notify_admin: Override the class default admin notification
         """
-        super().__init__(message, **kwargs)
+        super().__init__(message, error_code, details, cause, recoverable, notify_admin)
         
         self.retry_after = retry_after
         
-        if retry_after:
-            self.details["retry_after"] = retry_after
-        
-        if limit:
-            self.details["limit"] = limit
-        
-        if window:
-            self.details["window"] = window
+        self._merge_details({
+            "retry_after": retry_after,
+            "limit": limit,
+            "window": window,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -417,7 +542,7 @@ class MaintenanceError(UptimeBotException):
         super().__init__(message, **kwargs)
         
         if estimated_end:
-            self.details["estimated_end"] = estimated_end.isoformat()
+            self._set_detail("estimated_end", estimated_end.isoformat())
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -7,10 +7,46 @@ including connection issues, query errors, and data integrity problems.
 
 from __future__ import annotations
 
-from typing import Any, Optional, Type
+import re
+from typing import Any, Dict, Optional, Type
 from exceptions.base import UptimeBotException
 
 
+# Patterns used by _sanitize_query, compiled once
+_RE_STRING = re.compile(r"'[^']*'")
+_RE_NUMCMP = re.compile(r"= \d+")
+
+
+def _sanitize_query(
+    query: str,
+    _re_string: re.Pattern = _RE_STRING,
+    _re_numcmp: re.Pattern = _RE_NUMCMP
+) -> str:
+    """
+    Sanitize SQL query by removing sensitive values.
+    
+    Args:
+        query: The original SQL query
+        _re_string: String literal pattern bound at definition time
+        _re_numcmp: Numeric comparison pattern bound at definition time
+        
+    Returns:
+        Sanitized query string
+    """
+    # Basic sanitization - in production, use proper query logging
+    # Remove string values
+    query = _re_string.sub("'***'", query)
+    
+    # Remove numeric values in comparisons
+    query = _re_numcmp.sub("= ***", query)
+    
+    # Truncate if too long
+    if len(query) > 500:
+        query = query[:500] + "..."
+    
+    return query
+
+
 class DatabaseException(UptimeBotException):
     """
     Base Database Exception
@@ -40,38 +76,14 @@ class DatabaseException(UptimeBotException):
         """
         super().__init__(message, **kwargs)
         
-        if query:
+        self._merge_details({
             # Sanitize query by removing values
-            self.details["query"] = self._sanitize_query(query)
-        
-        if table:
-            self.details["table"] = table
+            "query": _sanitize_query(query) if query else None,
+            "table": table,
+        })
     
-    @staticmethod
-    def _sanitize_query(query: str) -> str:
-        """
-        Sanitize SQL query by removing sensitive values.
-        
-        Args:
-            query: The original SQL query
-            
-        Returns:
-            Sanitized query string
-        """
-        # Basic sanitization - in production, use proper query logging
-        import re
-        
-        # Remove string values
-        query = re.sub(r"'[^']*'", "'***'", query)
-        
-        # Remove numeric values in comparisons
-        query = re.sub(r"= \d+", "= ***", query)
-        
-        # Truncate if too long
-        if len(query) > 500:
-            query = query[:500] + "..."
-        
-        return query
+    # Kept as a static method for existing callers
+    _sanitize_query = staticmethod(_sanitize_query)
 
 
 class DatabaseConnectionError(DatabaseException):
@@ -103,14 +115,11 @@ class DatabaseConnectionError(DatabaseException):
         """
         super().__init__(message, **kwargs)
         
-        if host:
-            self.details["host"] = host
-        
-        if port:
-            self.details["port"] = port
-        
-        if database:
-            self.details["database"] = database
+        self._merge_details({
+            "host": host,
+            "port": port,
+            "database": database,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -130,7 +139,11 @@ class DatabaseQueryError(DatabaseException):
         self,
         message: str = "Database query failed",
         operation: Optional[str] = None,
-        **kwargs: Any
+        *,
+        query: Optional[str] = None,
+        table: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None
     ) -> None:
         """
         Initialize query error.
@@ -138,12 +151,15 @@ class DatabaseQueryError(DatabaseException):
         Args:
             message: Error message
             operation: The type of operation (SELECT, INSERT, etc.)
-            **kwargs: Additional arguments
+            query: The SQL query that caused the error (sanitized)
+            table: The database table involved
+            details: Additional error details
+            cause: The underlying exception that caused this one
         """
-        super().__init__(message, **kwargs)
+        super().__init__(message, query, table, details=details, cause=cause)
         
         if operation:
-            self.details["operation"] = operation
+            self._set_detail("operation", operation)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -166,7 +182,9 @@ class DatabaseNotFoundError(DatabaseException):
         message: str = "Record not found",
         entity_type: Optional[str] = None,
         entity_id: Optional[Any] = None,
-        **kwargs: Any
+        *,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None
     ) -> None:
         """
         Initialize not found error.
@@ -175,15 +193,15 @@ class DatabaseNotFoundError(DatabaseException):
             message: Error message
             entity_type: Type of entity not found (User, Link, etc.)
             entity_id: ID of the entity
-            **kwargs: Additional arguments
+            details: Additional error details
+            cause: The underlying exception that caused this one
         """
-        super().__init__(message, **kwargs)
+        super().__init__(message, details=details, cause=cause)
         
         if entity_type:
-            self.details["entity_type"] = entity_type
-        
+            self._set_detail("entity_type", entity_type)
         if entity_id is not None:
-            self.details["entity_id"] = str(entity_id)
+            self._set_detail("entity_id", str(entity_id))
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -222,14 +240,11 @@ class DatabaseDuplicateError(DatabaseException):
         """
         super().__init__(message, **kwargs)
         
-        if entity_type:
-            self.details["entity_type"] = entity_type
-        
-        if field:
-            self.details["field"] = field
-        
-        if value:
-            self.details["value"] = value[:50] if len(value) > 50 else value
+        self._merge_details({
+            "entity_type": entity_type,
+            "field": field,
+            "value": value[:50] if value else None,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -263,7 +278,7 @@ class DatabaseIntegrityError(DatabaseException):
         super().__init__(message, **kwargs)
         
         if constraint:
-            self.details["constraint"] = constraint
+            self._set_detail("constraint", constraint)
 
 
 class DatabaseTimeoutError(DatabaseException):
@@ -292,7 +307,7 @@ class DatabaseTimeoutError(DatabaseException):
         super().__init__(message, **kwargs)
         
         if timeout:
-            self.details["timeout"] = timeout
+            self._set_detail("timeout", timeout)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -326,11 +341,10 @@ class DatabaseMigrationError(DatabaseException):
         """
         super().__init__(message, **kwargs)
         
-        if migration_id:
-            self.details["migration_id"] = migration_id
-        
-        if direction:
-            self.details["direction"] = direction
+        self._merge_details({
+            "migration_id": migration_id,
+            "direction": direction,
+        })
 
 
 class DatabasePoolExhaustedError(DatabaseException):
@@ -360,11 +374,10 @@ class DatabasePoolExhaustedError(DatabaseException):
         """
         super().__init__(message, **kwargs)
         
-        if pool_size:
-            self.details["pool_size"] = pool_size
-        
-        if active_connections:
-            self.details["active_connections"] = active_connections
+        self._merge_details({
+            "pool_size": pool_size,
+            "active_connections": active_connections,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -399,7 +412,6 @@ class DatabaseTransactionError(DatabaseException):
         super().__init__(message, **kwargs)
         
         if transaction_id:
-            self.details["transaction_id"] = transaction_id
-        
+            self._set_detail("transaction_id", transaction_id)
         if rollback_successful is not None:
-            self.details["rollback_successful"] = rollback_successful
+            self._set_detail("rollback_successful", rollback_successful)
@@ -7,10 +7,23 @@ including URL validation, user input validation, and format errors.
 
 from __future__ import annotations
 
-from typing import Any, List, Optional, Type, Union
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 from exceptions.base import UptimeBotException
 
 
+def _bytes_quote(value: Union[bytes, bytearray]) -> str:
+    """
+    Get the quote character repr() uses for a bytes-like value.
+    
+    Args:
+        value: Bytes or bytearray
+        
+    Returns:
+        The quote character
+    """
+    return '"' if b"'" in value and b'"' not in value else "'"
+
+
 class ValidationException(UptimeBotException):
     """
     Base Validation Exception
@@ -41,10 +54,9 @@ class ValidationException(UptimeBotException):
         super().__init__(message, **kwargs)
         
         if field:
-            self.details["field"] = field
-        
+            self._set_detail("field", field)
         if value is not None:
-            self.details["value"] = self._sanitize_value(value)
+            self._set_detail("value", self._sanitize_value(value))
     
     @staticmethod
     def _sanitize_value(value: Any) -> str:
@@ -57,7 +69,18 @@ class ValidationException(UptimeBotException):
         Returns:
             Sanitized string representation
         """
-        str_value = str(value)
+        if isinstance(value, str):
+            str_value = value
+        elif isinstance(value, (bytes, bytearray)) and len(value) > 101:
+            # The repr of the first 101 bytes already covers the 100
+            # characters kept, as long as it picks the same quote style
+            head = value[:101]
+            if _bytes_quote(head) == _bytes_quote(value):
+                str_value = str(head)
+            else:
+                str_value = str(value)
+        else:
+            str_value = str(value)
         
         # Truncate long values
         if len(str_value) > 100:
@@ -75,6 +98,16 @@ class InvalidURLError(ValidationException):
     
     default_error_code = 3001
     
+    # user_message() text per reason, shared by all instances
+    _REASON_MESSAGES: ClassVar[Dict[str, str]] = {
+        "no_scheme": "URL must start with http:// or https://",
+        "invalid_domain": "The domain name is invalid",
+        "private_ip": "Private IP addresses are not allowed",
+        "localhost": "Localhost URLs are not allowed",
+        "too_long": "URL is too long (max 2048 characters)",
+        "blocked_domain": "This domain is not allowed"
+    }
+    
     def __init__(
         self,
         message: str = "Invalid URL format",
@@ -94,21 +127,14 @@ class InvalidURLError(ValidationException):
         super().__init__(message, field="url", value=url, **kwargs)
         
         if reason:
-            self.details["reason"] = reason
+            self._set_detail("reason", reason)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
-        reasons = {
-            "no_scheme": "URL must start with http:// or https://",
-            "invalid_domain": "The domain name is invalid",
-            "private_ip": "Private IP addresses are not allowed",
-            "localhost": "Localhost URLs are not allowed",
-            "too_long": "URL is too long (max 2048 characters)",
-            "blocked_domain": "This domain is not allowed"
-        }
-        
         reason = self.details.get("reason", "")
-        return reasons.get(reason, "Please provide a valid URL (e.g., https://example.com)")
+        return self._REASON_MESSAGES.get(
+            reason, "Please provide a valid URL (e.g., https://example.com)"
+        )
 
 
 class InvalidIntervalError(ValidationException):
@@ -141,15 +167,15 @@ class InvalidIntervalError(ValidationException):
         super().__init__(message, field="interval", value=interval, **kwargs)
         
         if min_interval is not None:
-            self.details["min_interval"] = min_interval
-        
+            self._set_detail("min_interval", min_interval)
         if max_interval is not None:
-            self.details["max_interval"] = max_interval
+            self._set_detail("max_interval", max_interval)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
-        min_val = self.details.get("min_interval")
-        max_val = self.details.get("max_interval")
+        details = self.details
+        min_val = details.get("min_interval")
+        max_val = details.get("max_interval")
         
         if min_val and max_val:
             return f"Interval must be between {min_val} and {max_val} seconds."
@@ -183,7 +209,7 @@ class InvalidUserDataError(ValidationException):
         super().__init__(message, **kwargs)
         
         if errors:
-            self.details["errors"] = errors
+            self._set_detail("errors", errors)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
@@ -256,15 +282,15 @@ class FieldTooLongError(ValidationException):
         super().__init__(message, field=field, **kwargs)
         
         if max_length is not None:
-            self.details["max_length"] = max_length
-        
+            self._set_detail("max_length", max_length)
         if actual_length is not None:
-            self.details["actual_length"] = actual_length
+            self._set_detail("actual_length", actual_length)
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
-        field = self.details.get("field", "Field")
-        max_len = self.details.get("max_length", "unknown")
+        details = self.details
+        field = details.get("field", "Field")
+        max_len = details.get("max_length", "unknown")
         return f"{field.capitalize()} must be {max_len} characters or less."
 
 
@@ -297,17 +323,17 @@ class InvalidFormatError(ValidationException):
         """
         super().__init__(message, field=field, **kwargs)
         
-        if expected_format:
-            self.details["expected_format"] = expected_format
-        
-        if example:
-            self.details["example"] = example
+        self._merge_details({
+            "expected_format": expected_format,
+            "example": example,
+        })
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
-        field = self.details.get("field", "Value")
-        expected = self.details.get("expected_format", "correct format")
-        example = self.details.get("example")
+        details = self.details
+        field = details.get("field", "Value")
+        expected = details.get("expected_format", "correct format")
+        example = details.get("example")
         
         msg = f"{field.capitalize()} must be in {expected}."
         
@@ -345,30 +371,31 @@ class MultipleValidationErrors(ValidationException):
         self.errors = errors or []
         
         if errors:
-            self.details["error_count"] = len(errors)
-            self.details["fields"] = [
-                e.details.get("field", "unknown") 
-                for e in errors 
-                if hasattr(e, "details")
-            ]
+            self._set_detail("error_count", len(errors))
+            # Every ValidationException carries details
+            self._set_detail("fields", [
+                e.details.get("field", "unknown") for e in errors
+            ])
     
     def add_error(self, error: ValidationException) -> None:
         """Add an error to the collection."""
         self.errors.append(error)
-        self.details["error_count"] = len(self.errors)
+        self._set_detail("error_count", len(self.errors))
     
     def user_message(self) -> str:
         """Get user-friendly error message."""
         if not self.errors:
             return "Validation failed."
         
-        messages = [e.user_message() for e in self.errors[:5]]
+        errors = self.errors
+        count = len(errors)
+        preview = count if count <= 5 else 5
         
         result = "Please fix the following errors:\n"
-        result += "\n".join(f"• {m}" for m in messages)
+        result += "\n".join(f"• {errors[i].user_message()}" for i in range(preview))
         
-        if len(self.errors) > 5:
-            result += f"\n... and {len(self.errors) - 5} more errors."
+        if count > 5:
+            result += f"\n... and {count - 5} more errors."
         
         return result
     
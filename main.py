@@ -59,7 +59,9 @@ from typing import Optional
 # ---------------------------------------------------------------------------
 # Path setup — ensure the project root is importable regardless of CWD
 # ---------------------------------------------------------------------------
-sys.path.insert(0, str(Path(__file__).parent))
+_PROJECT_ROOT = str(Path(__file__).parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 # ---------------------------------------------------------------------------
 # Project imports
@@ -146,8 +148,9 @@ class UptimeBotApplication:
         """Initialize the database manager and verify connectivity."""
         logger.info("── Phase 1: Database ─────────────────────────────")
         try:
-            self.db_manager = DatabaseManager(self.settings)
-            await self.db_manager.initialize()
+            self.db_manager = DatabaseManager()
+            # Opens the engine, tests the connection and warms the pool
+            await self.db_manager.connect()
 
             if not await self.db_manager.check_connection():
                 logger.error("✗ Database connection check failed")
@@ -392,7 +395,7 @@ class UptimeBotApplication:
         # 7. Close database connections
         if self.db_manager:
             try:
-                await self.db_manager.close()
+                await self.db_manager.disconnect()
                 logger.info("  ✓ Database connections closed")
             except Exception as e:
                 logger.error(f"  ✗ Database close error: {e}")
@@ -48,7 +48,9 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
-from database.models import Alert, AlertType, NotificationChannel
+from sqlalchemy import bindparam, select
+
+from database.models import Alert, AlertType, NotificationChannel, User
 from database.manager import DatabaseManager
 from config.settings import Settings, get_settings
 from utils.logger import get_logger
@@ -56,6 +58,9 @@ from utils.logger import get_logger
 
 logger = get_logger("AlertManager")
 
+# Built once at import; callers only bind the users.id value
+_TELEGRAM_ID_BY_PK = select(User.user_id).where(User.id == bindparam("pk"))
+
 
 # ============================================================================
 # ALERT PAYLOAD (internal queue item)
@@ -272,7 +277,6 @@ class AlertManager:
                     async with self.db_manager.session() as session:
                         merged = await session.merge(alert_row)
                         merged.mark_as_sent()
-                        await session.commit()
                 except Exception as e:
                     logger.error(f"[AlertManager] Failed to mark alert as sent: {e}")
         elif not send_allowed:
@@ -372,10 +376,10 @@ class AlertManager:
                 metadata=payload.metadata,
             )
 
+            # The INSERT returns the generated id and every other column has
+            # a client-side default, so no refresh SELECT is needed
             async with self.db_manager.session() as session:
                 session.add(alert)
-                await session.commit()
-                await session.refresh(alert)
 
             logger.debug(
                 f"[AlertManager] Alert persisted — id={alert.id}, "
@@ -451,12 +455,9 @@ class AlertManager:
         in this schema (user_id column stores the Telegram ID).
         """
         try:
-            from database.models import User
-            from sqlalchemy import select
-
-            async with self.db_manager.session() as session:
+            async with self.db_manager.session(readonly=True) as session:
                 result = await session.execute(
-                    select(User.user_id).where(User.id == db_user_id)
+                    _TELEGRAM_ID_BY_PK, {"pk": db_user_id}
                 )
                 row = result.scalar_one_or_none()
                 return row
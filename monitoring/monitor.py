@@ -46,7 +46,8 @@ from database.models import (
     MonitoredLink, PingLog, LinkStatus, MonitorType,
     AlertType, User
 )
-from database.manager import DatabaseManager, LinkRepository
+from database.manager import DatabaseManager
+from database.repositories import LinkRepository
 from config.settings import Settings, get_settings
 from utils.logger import get_logger
 from utils.helpers import TimeHelper, BatchProcessor
@@ -959,7 +960,6 @@ class MonitoringEngine:
 
             async with self.db_manager.session() as session:
                 session.add(ping_log)
-                await session.commit()
 
             logger.debug(f"[Engine] PingLog recorded for link {link.id}")
 
@@ -1113,7 +1113,6 @@ class MonitoringEngine:
             async with self.db_manager.session() as session:
                 # Merge detached instance back into this session
                 merged_link = await session.merge(link)
-                await session.commit()
 
             logger.debug(
                 f"[Engine] Link {link.id} metrics updated — "
@@ -38,6 +38,7 @@ License: MIT
 
 import asyncio
 import time
+from contextlib import aclosing
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Callable, List
 from dataclasses import dataclass, field
@@ -49,12 +50,23 @@ from database.models import (
     UserStatus, LinkStatus, MonitorType, AlertType
 )
 from database.manager import DatabaseManager
+from config.constants import Feature
 from config.settings import Settings, get_settings
 from utils.logger import get_logger
 
 
 logger = get_logger("Scheduler")
 
+# Built once at import instead of on every SSL sweep
+_SSL_EXPIRING_LINKS = select(MonitoredLink).where(
+    and_(
+        MonitoredLink.is_active == True,
+        MonitoredLink.is_deleted == False,
+        MonitoredLink.ssl_days_remaining.isnot(None),
+        MonitoredLink.ssl_days_remaining <= 30,
+    )
+)
+
 
 # ============================================================================
 # JOB DEFINITION
@@ -314,7 +326,7 @@ class Scheduler:
             "ssl_expiry_sweep",
             interval_seconds=21600,
             coroutine_factory=self._job_ssl_expiry_sweep,
-            enabled=self.settings.ENABLE_SSL_MONITORING,
+            enabled=Feature.SSL_MONITORING in self.settings.features,
         )
 
         # 4. Cooldown map GC (every 1 hour)
@@ -350,30 +362,30 @@ class Scheduler:
             async with self.db_manager.session() as session:
                 # --- user counts ---
                 total_users = await session.scalar(
-                    select(func.count(User.id))
+                    select(func.count()).select_from(User)
                 ) or 0
                 active_users = await session.scalar(
-                    select(func.count(User.id)).where(
+                    select(func.count()).select_from(User).where(
                         User.status == UserStatus.ACTIVE
                     )
                 ) or 0
                 premium_users = await session.scalar(
-                    select(func.count(User.id)).where(
+                    select(func.count()).select_from(User).where(
                         User.is_premium == True
                     )
                 ) or 0
 
                 # --- link counts ---
                 total_links = await session.scalar(
-                    select(func.count(MonitoredLink.id))
+                    select(func.count()).select_from(MonitoredLink)
                 ) or 0
                 active_links = await session.scalar(
-                    select(func.count(MonitoredLink.id)).where(
+                    select(func.count()).select_from(MonitoredLink).where(
                         MonitoredLink.is_active == True
                     )
                 ) or 0
                 up_links = await session.scalar(
-                    select(func.count(MonitoredLink.id)).where(
+                    select(func.count()).select_from(MonitoredLink).where(
                         and_(
                             MonitoredLink.is_active == True,
                             MonitoredLink.is_up == True
@@ -444,8 +456,6 @@ class Scheduler:
                     )
                     session.add(stats_row)
 
-                await session.commit()
-
             logger.debug(
                 f"[StatsAgg] users={total_users}, links={total_links}, "
                 f"up={up_links}, down={down_links}"
@@ -482,18 +492,12 @@ class Scheduler:
         recently (e.g., high-interval links).
         """
         try:
-            async with self.db_manager.session() as session:
-                result = await session.execute(
-                    select(MonitoredLink).where(
-                        and_(
-                            MonitoredLink.is_active == True,
-                            MonitoredLink.is_deleted == False,
-                            MonitoredLink.ssl_days_remaining.isnot(None),
-                            MonitoredLink.ssl_days_remaining <= 30,
-                        )
-                    )
-                )
-                expiring_links = result.scalars().all()
+            # Collect the batch first so the stream's session is closed
+            # before any alert is sent; aclosing() also closes it on errors
+            async with aclosing(
+                self.db_manager.stream_scalars(_SSL_EXPIRING_LINKS)
+            ) as stream:
+                expiring_links = [link async for link in stream]
 
             if not expiring_links:
                 logger.debug("[SSLSweep] No certificates expiring soon")
@@ -568,6 +572,9 @@ class Scheduler:
         Does NOT delete them or their links — just changes status for
         reporting purposes.
         """
+        # Computed in Python and sent as a bound parameter: now() minus an
+        # interval is not portable (SQLite renders it as CURRENT_TIMESTAMP
+        # minus a number), and the cached statement text is the same anyway
         cutoff_date = datetime.utcnow() - timedelta(days=90)
 
         try:
@@ -583,7 +590,6 @@ class Scheduler:
                     )
                     .values(status=UserStatus.INACTIVE)
                 )
-                await session.commit()
                 updated = result.rowcount
 
             if updated:
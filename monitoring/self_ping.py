@@ -175,6 +175,7 @@ class SelfPinger:
         self._target_url = self._resolve_target_url()
         self._interval = settings.SELF_PING_INTERVAL  # default 300s (5 min)
         self._timeout = settings.SELF_PING_TIMEOUT    # default 15s
+        self._http_timeout = httpx.Timeout(self._timeout)  # built once, reused per ping
         self._retry_count = settings.SELF_PING_RETRY_COUNT  # default 3
 
         # State
@@ -295,7 +296,7 @@ class SelfPinger:
         for attempt in range(self._retry_count + 1):
             try:
                 async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(self._timeout)
+                    timeout=self._http_timeout
                 ) as client:
                     response = await client.get(self._target_url)
 